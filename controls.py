@@ -4,10 +4,11 @@ from matplotlib.widgets import Slider
 
 
 class ControlPanelMSG:
-    def __init__(self, params, on_process_change, on_toggle_gen):
+    def __init__(self, params, on_process_change, on_toggle_gen, on_tension_change):
         self.params = params
         self.on_process_change = on_process_change
         self.on_toggle_gen = on_toggle_gen
+        self.on_tension_change = on_tension_change
         self.sliders = []
         self.checks = []
 
@@ -18,6 +19,10 @@ class ControlPanelMSG:
 
         self.fig.canvas.manager.set_window_title("Control Panel")
 
+        # Image re-processing is debounced: dragging a slider fires on every
+        # mouse move, so only process once the value has settled for 30 ms
+        self.process_timer = self._debounce_timer(self.on_process_change)
+
         # Adjust layout
         # We'll use manual positioning, so subplots_adjust isn't critical
         # but keeps default areas clean.
@@ -81,6 +86,7 @@ class ControlPanelMSG:
             0.1,
             2.0,
             start_y=y,
+            on_change=self.on_tension_change,
             desc="Smoothness (Sigma). Higher = Smoother.",
         )
 
@@ -132,6 +138,7 @@ class ControlPanelMSG:
         valstep=None,
         start_y=0.9,
         is_process=False,
+        on_change=None,
         desc="",
     ):
         # Layout:
@@ -157,11 +164,26 @@ class ControlPanelMSG:
         if desc:
             self.fig.text(0.30, start_y - 0.025, desc, fontsize=8, color="#555555")
 
+        # on_change is debounced like image re-processing
+        change_timer = self._debounce_timer(on_change) if on_change else None
+
         # Callback
         def update(val):
             self.params[key] = val
+            # Restart the countdowns
             if is_process:
-                self.on_process_change()
+                self.process_timer.stop()
+                self.process_timer.start()
+            if change_timer is not None:
+                change_timer.stop()
+                change_timer.start()
 
         slider.on_changed(update)
         self.sliders.append(slider)
+
+    def _debounce_timer(self, callback, interval=30):
+        """Single-shot timer that runs callback once restarts stop for interval ms."""
+        timer = self.fig.canvas.new_timer(interval=interval)
+        timer.single_shot = True
+        timer.add_callback(callback)
+        return timer
@@ -5,12 +5,19 @@ import matplotlib
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.colors import ListedColormap, to_rgba
 from matplotlib.widgets import Button
 from PIL import Image
-from scipy.ndimage import gaussian_filter1d
+from scipy import sparse
+from scipy.ndimage import correlate1d, gaussian_filter
 
 from controls import ControlPanelMSG
 
+try:
+    import numba
+except ImportError:  # Optional: falls back to the NumPy implementation
+    numba = None
+
 root = tk.Tk()
 root.withdraw()
 
@@ -25,6 +32,24 @@ INITIAL_DOT_COLOR = "#e1ebf5"
 # Smoother animation, but may cause some rendering issues
 USE_BLIT = False
 
+# Draw particles by marking pixels of a CANVAS_SIZE image instead of a scatter
+# plot. Much cheaper with many lines, but dots snap to the pixel grid.
+RASTERIZE_DOTS = False
+
+# Run the particle physics on a half-resolution grid: every 2nd row (the rows
+# in between are interpolated for drawing) and a 256x256 brightness map.
+# About half the per-frame work, but the lines follow visibly different paths
+# than at full resolution (drifting by tens of pixels over a few hundred frames).
+HALF_RES_PHYSICS = False
+
+# Apply the LINE_TENSION smoothing only every N frames, with the kernel
+# composed N times so the overall amount of smoothing stays the same
+SMOOTH_EVERY = 3
+
+# Upper bound on simultaneously alive lines (rows of the particle buffer).
+# When full, the oldest line is dropped to make room for a new one.
+MAX_COLS = 1024
+
 # --- Global Parameters Dictionary ---
 # Replaced individual constants with a mutable dictionary to support UI sliders
 PARAMS = {
@@ -63,6 +88,10 @@ PARAMS = {
 current_image_path = "input.jpg"
 # Cache for raw normalized data (before effects) to optimize slider performance
 raw_normalized_data = None
+# S-curve lookup table, rebuilt only when (steepness, midpoint) changes
+SCURVE_LUT_SIZE = 4096
+scurve_lut = None
+scurve_key = None
 
 # ==========================================
 #          Image Processing Logic
@@ -88,7 +117,7 @@ def crop_center_square(img):
 def load_image_data(image_path: str):
     """
     Load, crop, resize, and normalize image.
-    Returns raw normalized float array (0-1).
+    Returns raw normalized float32 array (0-1).
     """
     try:
         if image_path:
@@ -105,43 +134,81 @@ def load_image_data(image_path: str):
         )
 
     # 1. Crop and scale
+    # For JPEGs, let the decoder downscale (by 1/2, 1/4 or 1/8) and decode
+    # straight to grayscale, keeping both sides at least CANVAS_SIZE.
+    # No-op for other formats.
+    input_img.draft("L", (CANVAS_SIZE, CANVAS_SIZE))
     input_img = crop_center_square(input_img)
     input_img = input_img.convert("L")
-    input_img = input_img.resize((CANVAS_SIZE, CANVAS_SIZE), Image.Resampling.LANCZOS)
+    # reducing_gap: cheap integer box reduction first, LANCZOS only for the
+    # last (at most 3x) step
+    input_img = input_img.resize(
+        (CANVAS_SIZE, CANVAS_SIZE), Image.Resampling.LANCZOS, reducing_gap=3.0
+    )
 
     # 2. Normalize
-    data = np.array(input_img) / 255.0
+    # float32 throughout the pipeline: half the memory of float64
+    data = np.asarray(input_img, dtype=np.float32)
+    data *= 1.0 / 255.0
 
     # --- Image Enhancement (Static) ---
 
     # Histogram stretching: Expand darkest and brightest ranges to ensure sufficient dynamic range
-    p_min, p_max = np.percentile(data, (2, 98))
+    p_min, p_max = (float(p) for p in np.percentile(data, (2, 98)))
     if p_max - p_min > 0:
-        data = (data - p_min) / (p_max - p_min)
-    data = np.clip(data, 0, 1)
+        data -= p_min
+        data /= p_max - p_min
+    np.clip(data, 0, 1, out=data)
 
     return data
 
 
+def get_scurve_lut(steepness, midpoint):
+    """
+    Sigmoid sampled on [0, 1], cached across calls with the same parameters.
+    """
+    global scurve_lut, scurve_key
+    if scurve_key != (steepness, midpoint):
+        xs = np.linspace(0, 1, SCURVE_LUT_SIZE, dtype=np.float32)
+        scurve_lut = 1 / (1 + np.exp(-(xs - midpoint) * steepness))
+        scurve_key = (steepness, midpoint)
+    return scurve_lut
+
+
 def apply_image_effects(data):
     """
     Apply real-time effects (contrast, blur) to normalized data.
     """
     # S-curve: Nonlinear contrast adjustment
     # Purpose is to darken background noise while enhancing midtone layers (clothing/facial features)
+    # The slider stops at 1.0; the steepness guard is only for values set
+    # directly in PARAMS, where a flat curve would map every pixel to 0.5.
+    # Treat it as "no contrast" instead.
     steepness = PARAMS["contrast_steepness"]
     midpoint = PARAMS["contrast_midpoint"]
-    data = 1 / (1 + np.exp(-(data - midpoint) * steepness))
-
-    # Re-normalize to 0-1
-    data = (data - data.min()) / (data.max() - data.min())
+    if steepness > 1e-6:
+        # Table lookup instead of exp() per pixel; error is below 1/4096
+        lut = get_scurve_lut(steepness, midpoint)
+        indices = (data * (SCURVE_LUT_SIZE - 1) + 0.5).astype(np.uint16)
+
+        # Re-normalize to 0-1. The curve is increasing, so the output range
+        # is set by the smallest and largest index: normalize the table, not
+        # the image, and the lookup is the only full-image pass.
+        lo = lut[indices.min()]
+        hi = lut[indices.max()]
+        # Skipped for a single-valued image, avoiding a 0/0
+        if hi > lo:
+            lut = (lut - lo) / (hi - lo)
+        data = np.take(lut, indices)
 
     # 3. Preprocessing blur
+    # Separable 2D Gaussian, both axes in a single C call
     sigma = PARAMS["blur_sigma"]
-    data = gaussian_filter1d(data, sigma=sigma, axis=0)
-    data = gaussian_filter1d(data, sigma=sigma, axis=1)
+    if sigma > 0:
+        data = gaussian_filter(data, sigma=sigma, mode="reflect")
 
-    return np.flipud(data * 255.0)
+    # Stored as 8-bit brightness: 4x less memory for the per-frame lookups
+    return (np.flipud(data) * 255.0 + 0.5).astype(np.uint8)
 
 
 # Initialize data
@@ -178,14 +245,188 @@ img_obj = ax.imshow(
     visible=False,
 )
 
+
+def dot_colormap(color):
+    """Two-entry colormap for the rasterized dots: transparent, dot color."""
+    return ListedColormap([(0.0, 0.0, 0.0, 0.0), to_rgba(color, alpha=0.9)])
+
+
 # Particle object
-# Enable clipping to ensure points don't bleed out (important for blit)
-scat = ax.scatter(
-    [], [], s=0.2, c=current_dot_color, alpha=0.9, marker="o", clip_on=True
-)
+if RASTERIZE_DOTS:
+    # Pixels hit by a particle are set to 1
+    dots_canvas = np.zeros((CANVAS_SIZE, CANVAS_SIZE), dtype=np.uint8)
+    scat = ax.imshow(
+        dots_canvas,
+        cmap=dot_colormap(current_dot_color),
+        vmin=0,
+        vmax=1,
+        origin="lower",
+        extent=(0, CANVAS_SIZE, 0, CANVAS_SIZE),
+    )
+else:
+    # Enable clipping to ensure points don't bleed out (important for blit)
+    scat = ax.scatter(
+        [], [], s=0.2, c=current_dot_color, alpha=0.9, marker="o", clip_on=True
+    )
 
 # Global variables
-particles_x = []
+# Physics runs on every ROW_STRIDE-th canvas row (see HALF_RES_PHYSICS)
+ROW_STRIDE = 2 if HALF_RES_PHYSICS else 1
+N_ROWS = CANVAS_SIZE // ROW_STRIDE
+physics_rows = np.arange(N_ROWS)
+
+# One row per line: particles_x[c, i] is the x position of line c at canvas
+# row i * ROW_STRIDE.
+# Alive lines are the contiguous window [col_head, col_tail), oldest first,
+# so a birth is a single row write and the oldest lines dying is a head shift.
+particles_x = np.empty((MAX_COLS, N_ROWS), dtype=np.float32)
+col_head = 0
+col_tail = 0
+# Full-resolution x positions for drawing when the physics is decimated
+if ROW_STRIDE > 1:
+    render_x = np.empty((MAX_COLS, CANVAS_SIZE), dtype=np.float32)
+
+
+def downsample_for_physics(pixels):
+    """
+    Brightness map sampled by the particle physics, on the physics grid.
+    A compact copy keeps the per-frame lookups cache-friendly.
+    """
+    return np.ascontiguousarray(pixels[::ROW_STRIDE, ::ROW_STRIDE])
+
+
+pixels_phys = downsample_for_physics(pixels)
+
+# Add a small margin to prevent edge artifacts when blitting
+# Points exactly on the edge might not be cleared properly by the background restore
+EDGE_MARGIN = 2
+# Per-frame scatter inputs that only depend on the line count are built once
+# for a full buffer and sliced: row index of every particle, whether that row
+# is inside the margin, and the output mask.
+y_indices = np.arange(CANVAS_SIZE)
+all_y_tiled = np.tile(y_indices.astype(np.float32), MAX_COLS)
+y_in_margin = (all_y_tiled > EDGE_MARGIN) & (all_y_tiled < CANVAS_SIZE - EDGE_MARGIN)
+mask_buffer = np.empty(MAX_COLS * CANVAS_SIZE, dtype=np.bool_)
+# Visible (x, y) points are written here in place and a prefix is handed to
+# the scatter
+offsets_buffer = np.empty((MAX_COLS * CANVAS_SIZE, 2), dtype=np.float32)
+# Sparse (N_ROWS, N_ROWS) matrix applying the LINE_TENSION smoothing
+tension_matrix = None
+# The same smoothing as 1D Gaussian taps, used by the Numba kernel and for
+# small kernels on the NumPy path
+tension_weights = None
+# Lines with reflected edges, so small kernels run as plain slice arithmetic
+tension_padded = None
+# Kernels up to this radius use the padded slices, wider ones the sparse matrix
+SMALL_KERNEL_RADIUS = 2
+
+
+def gaussian_kernel1d(sigma, truncate=4.0, min_radius=0):
+    """
+    Normalized 1D Gaussian taps, matching scipy.ndimage's kernel radius.
+    """
+    radius = max(int(truncate * sigma + 0.5), min_radius)
+    x = np.arange(-radius, radius + 1, dtype=np.float32)
+    weights = np.exp(-0.5 * (x / sigma) ** 2)
+    return weights / weights.sum()
+
+
+def kernel_variance(weights):
+    """
+    Variance (in taps^2) of a normalized, centered kernel.
+    """
+    radius = len(weights) // 2
+    x = np.arange(-radius, radius + 1)
+    return float(np.sum(weights * x**2))
+
+
+def kernel_with_variance(variance):
+    """
+    Sampled Gaussian taps whose actual variance matches the given one.
+    Found by bisection on sigma, since a sampled kernel's variance is not
+    sigma^2 for small sigmas. At least 3 taps, so tiny variances survive.
+    """
+    lo, hi = 1e-3, 4.0 * np.sqrt(variance) + 1.0
+    for _ in range(50):
+        sigma = 0.5 * (lo + hi)
+        if kernel_variance(gaussian_kernel1d(sigma, min_radius=1)) < variance:
+            lo = sigma
+        else:
+            hi = sigma
+    return gaussian_kernel1d(0.5 * (lo + hi), min_radius=1)
+
+
+def trim_kernel(weights):
+    """
+    Drop outer taps too small to matter and renormalize.
+    """
+    cut = int(np.argmax(weights >= 1e-4 * weights.max()))
+    weights = weights[cut : len(weights) - cut]
+    return weights / weights.sum()
+
+
+def rebuild_tension_kernel():
+    """
+    Precompute the line smoothing once per LINE_TENSION value: Gaussian taps,
+    plus a padded scratch buffer for small kernels or a banded sparse matrix
+    for wide ones (row i is the smoothed unit impulse at i, so the 'reflect'
+    boundary is baked in).
+    """
+    global tension_matrix, tension_weights, tension_padded
+    # Per-frame taps at canvas resolution (sigma is in canvas rows)
+    step = gaussian_kernel1d(PARAMS["LINE_TENSION"])
+
+    # SMOOTH_EVERY applications of the per-frame kernel, as one kernel.
+    # Composing the sampled taps (rather than scaling sigma by sqrt(N)) keeps
+    # small sigmas right, where the sampled kernel is much narrower than sigma.
+    weights = step
+    for _ in range(SMOOTH_EVERY - 1):
+        weights = np.convolve(weights, step)
+    weights = trim_kernel(weights)
+
+    if ROW_STRIDE > 1:
+        # Same physical smoothing on the coarser physics grid: match the
+        # variance in physics rows, not the nominal sigma
+        variance = kernel_variance(weights) / ROW_STRIDE**2
+        weights = trim_kernel(kernel_with_variance(variance))
+    tension_weights = weights.astype(np.float32)
+    radius = len(tension_weights) // 2
+
+    if radius > SMALL_KERNEL_RADIUS:
+        impulses = np.eye(N_ROWS, dtype=np.float32)
+        kernel = correlate1d(impulses, tension_weights, axis=1, mode="reflect")
+        tension_matrix = sparse.csr_matrix(kernel)
+    else:
+        tension_matrix = None
+        # Reuse the padded buffer while the kernel width is unchanged
+        width = N_ROWS + 2 * radius
+        if tension_padded is None or tension_padded.shape[1] != width:
+            tension_padded = np.empty((MAX_COLS, width), dtype=np.float32)
+
+
+def smooth_lines(cols):
+    """
+    Apply the LINE_TENSION smoothing along each line of cols, in place.
+    """
+    radius = len(tension_weights) // 2
+    if radius == 0:
+        return
+    if radius > SMALL_KERNEL_RADIUS:
+        cols[:] = cols @ tension_matrix
+        return
+
+    # Small kernel: copy lines into the padded buffer with 'reflect' edges
+    # (d c b a | a b c d | d c b a) and sum shifted slices
+    padded = tension_padded[: len(cols)]
+    padded[:, radius:-radius] = cols
+    padded[:, :radius] = cols[:, :radius][:, ::-1]
+    padded[:, -radius:] = cols[:, -radius:][:, ::-1]
+    np.multiply(padded[:, :N_ROWS], tension_weights[0], out=cols)
+    for k in range(1, len(tension_weights)):
+        cols += tension_weights[k] * padded[:, k : k + N_ROWS]
+
+
+rebuild_tension_kernel()
 frame_count = 0
 is_generating = True
 
@@ -205,7 +446,8 @@ def toggle_view(event):
 
 def select_image(event):
     """Select image file"""
-    global pixels, particles_x, frame_count, current_image_path, raw_normalized_data
+    global pixels, pixels_phys, col_head, col_tail, frame_count
+    global current_image_path, raw_normalized_data
 
     # Use the global hidden root for dialogs
     file_path = filedialog.askopenfilename(
@@ -219,9 +461,10 @@ def select_image(event):
         raw_normalized_data = load_image_data(file_path)
         # Apply effects
         pixels = apply_image_effects(raw_normalized_data)
+        pixels_phys = downsample_for_physics(pixels)
 
         img_obj.set_data(pixels)
-        particles_x = []  # Clear current lines
+        col_head = col_tail = 0  # Clear current lines
         frame_count = 0
         plt.draw()
 
@@ -271,7 +514,10 @@ def set_dot_color(event):
 
     if color:
         current_dot_color = color
-        scat.set_color(current_dot_color)
+        if RASTERIZE_DOTS:
+            scat.set_cmap(dot_colormap(current_dot_color))
+        else:
+            scat.set_color(current_dot_color)
         plt.draw()
 
     if raw_normalized_data is not None:
@@ -347,8 +593,66 @@ btn_stop = create_styled_button(ax_btn_stop, "Stop", toggle_generation)
 # ==========================================
 
 
+def _step_particles(
+    cols, pixels, x_stride, base_speed, drag, accel, weights, scratch, alive
+):
+    """
+    Move and smooth every line in place (Numba kernel).
+    pixels is the physics brightness map, x_stride the canvas pixels per column.
+    Lines are independent, so they are spread across cores.
+    """
+    n_cols, n_rows = cols.shape
+    width = pixels.shape[1] * x_stride
+    radius = weights.shape[0] // 2
+    for c in numba.prange(n_cols):
+        row = cols[c]
+        moved = scratch[c]
+
+        # Brightness-dependent speed
+        for y in range(n_rows):
+            px = row[y]
+            xi = min(max(int(px), 0), width - 1) // x_stride
+            moved[y] = px + base_speed - drag * pixels[y, xi] + px * accel
+
+        # Smooth along y ('reflect' boundary, like scipy.ndimage)
+        # Seeded from the first value: fastmath assumes no infinities
+        row_min = 0.0
+        for y in range(n_rows):
+            acc = 0.0
+            for k in range(-radius, radius + 1):
+                j = y + k
+                if j < 0:
+                    j = -j - 1
+                elif j >= n_rows:
+                    j = 2 * n_rows - j - 1
+                acc += weights[k + radius] * moved[j]
+            row[y] = acc
+            if y == 0 or acc < row_min:
+                row_min = acc
+
+        alive[c] = row_min < width
+
+
+if numba is not None:
+    _step_particles = numba.njit(parallel=True, fastmath=True, cache=True)(
+        _step_particles
+    )
+    # Per-line scratch rows for the kernel
+    step_scratch = np.empty_like(particles_x)
+    # Passed instead of tension_weights on frames without smoothing
+    identity_weights = np.ones(1, dtype=np.float32)
+    step_alive = np.empty(MAX_COLS, dtype=np.bool_)
+else:
+    # Per-frame scratch for the NumPy brightness lookup
+    clip_buffer = np.empty_like(particles_x)
+    index_buffer = np.empty(particles_x.shape, dtype=np.intp)
+    brightness_buffer = np.empty(particles_x.shape, dtype=np.uint8)
+    # Flat offset of each physics row in pixels_phys
+    row_offsets = physics_rows * (CANVAS_SIZE // ROW_STRIDE)
+
+
 def animate(frame):
-    global frame_count, particles_x
+    global frame_count, col_head, col_tail
 
     frame_count += 1
 
@@ -359,64 +663,114 @@ def animate(frame):
     p_base_speed = PARAMS["BASE_SPEED"]
     p_friction = PARAMS["FRICTION_FACTOR"]
     p_acceleration = PARAMS["ACCELERATION"]
-    p_line_tension = PARAMS["LINE_TENSION"]
+    # Speed lost per brightness level (0-255), folds the /255 normalization
+    # into one constant: speed = base_speed - brightness_drag * brightness
+    brightness_drag = p_base_speed * p_friction / 255.0
 
     # Generate new lines
     if is_generating and frame_count % p_frame_interval == 0:
-        lines_to_gen = p_lines_per_frame
-        # If > 1 line per frame, we might want to offset them or just add multiple identical columns
-        # Original code added 1 column. With multiline, we append multiple times.
-        for _ in range(lines_to_gen):
-            new_column = np.zeros(CANVAS_SIZE)
-            particles_x.append(new_column)
-
-    active_particles = []
-    y_indices = np.arange(CANVAS_SIZE)
-
-    for col_x in particles_x:
-        # Get brightness
-        current_x_int = np.clip(col_x, 0, CANVAS_SIZE - 1).astype(int)
-        brightness = pixels[y_indices, current_x_int]
-        norm_b = brightness / 255.0
-
-        # Calculate speed
-        current_speed = p_base_speed * (1.0 - (norm_b * p_friction))
-        x_accel = col_x * p_acceleration
-        final_speed = current_speed + x_accel
-
-        # Move
-        col_x += final_speed
-
-        # Smooth
-        col_x[:] = gaussian_filter1d(col_x, sigma=p_line_tension)
+        lines_to_gen = min(p_lines_per_frame, MAX_COLS)
+        # If > 1 line per frame, multiple identical columns are added
+        if col_tail + lines_to_gen > MAX_COLS:
+            # Out of room at the end: slide alive lines back to the front,
+            # dropping the oldest ones if the buffer is full
+            col_head += max(col_tail - col_head + lines_to_gen - MAX_COLS, 0)
+            n_alive = col_tail - col_head
+            particles_x[:n_alive] = particles_x[col_head:col_tail]
+            col_head, col_tail = 0, n_alive
+        particles_x[col_tail : col_tail + lines_to_gen] = 0.0
+        col_tail += lines_to_gen
+
+    n_cols = col_tail - col_head
+    smooth_now = frame_count % SMOOTH_EVERY == 0
+    if n_cols:
+        # All alive lines are processed at once as a (n_cols, N_ROWS) block
+        cols = particles_x[col_head:col_tail]
+
+        if numba is not None:
+            keep = step_alive[:n_cols]
+            _step_particles(
+                cols,
+                pixels_phys,
+                ROW_STRIDE,
+                p_base_speed,
+                brightness_drag,
+                p_acceleration,
+                tension_weights if smooth_now else identity_weights,
+                step_scratch,
+                keep,
+            )
+        else:
+            # Get brightness
+            # Clip and truncate into reused buffers, then gather with flat
+            # indices (np.take is ~2x faster than 2D fancy indexing)
+            clipped = np.clip(cols, 0, CANVAS_SIZE - 1, out=clip_buffer[:n_cols])
+            if ROW_STRIDE > 1:
+                clipped *= 1.0 / ROW_STRIDE
+            current_x_int = index_buffer[:n_cols]
+            np.copyto(current_x_int, clipped, casting="unsafe")
+            current_x_int += row_offsets
+            brightness = np.take(
+                pixels_phys, current_x_int, out=brightness_buffer[:n_cols]
+            )
+
+            # Calculate speed
+            current_speed = p_base_speed - brightness_drag * brightness
+            x_accel = cols * p_acceleration
+            final_speed = current_speed + x_accel
+
+            # Move
+            cols += final_speed
+
+            # Smooth each line along y in a single call
+            if smooth_now:
+                smooth_lines(cols)
+
+            # Keep points within canvas
+            keep = cols.min(axis=1) < CANVAS_SIZE
+
+        if not keep.all():
+            first_alive = int(np.argmax(keep)) if keep.any() else n_cols
+            if keep[first_alive:].all():
+                # Only the oldest lines left the canvas
+                col_head += first_alive
+            else:
+                n_alive = int(np.count_nonzero(keep))
+                particles_x[col_head : col_head + n_alive] = cols[keep]
+                col_tail = col_head + n_alive
+            n_cols = col_tail - col_head
 
-        # Keep points within canvas
-        if np.min(col_x) < CANVAS_SIZE:
-            active_particles.append(col_x)
+    # Update scatter data
+    if n_cols:
+        n_points = n_cols * CANVAS_SIZE
+        if ROW_STRIDE > 1:
+            # Linearly interpolate the skipped rows (last row is held)
+            cols = particles_x[col_head:col_tail]
+            full = render_x[:n_cols]
+            full[:, ::ROW_STRIDE] = cols
+            full[:, 1:-1:ROW_STRIDE] = 0.5 * (cols[:, :-1] + cols[:, 1:])
+            full[:, -1] = cols[:, -1]
+            all_x = full.ravel()
+        else:
+            all_x = particles_x[col_head:col_tail].ravel()
+        all_y = all_y_tiled[:n_points]
 
-    particles_x = active_particles
+        mask = np.less(all_x, CANVAS_SIZE - EDGE_MARGIN, out=mask_buffer[:n_points])
+        mask &= y_in_margin[:n_points]
 
-    # Update scatter data
-    if particles_x:
-        all_x = np.array(particles_x).flatten()
-        all_y = np.tile(y_indices, len(particles_x))
-
-        # Add a small margin to prevent edge artifacts when blitting
-        # Points exactly on the edge might not be cleared properly by the background restore
-        margin = 2
-        mask = (
-            (all_x < CANVAS_SIZE - margin)
-            & (all_y > margin)
-            & (all_y < CANVAS_SIZE - margin)
-        )
+        n_visible = int(np.count_nonzero(mask))
+        data = offsets_buffer[:n_visible]
+        np.compress(mask, all_x, out=data[:, 0])
+        np.compress(mask, all_y, out=data[:, 1])
+    else:
+        data = offsets_buffer[:0]
 
-        if np.any(mask):
-            data = np.stack([all_x[mask], all_y[mask]], axis=1)
-            scat.set_offsets(data)
-        else:
-            scat.set_offsets(np.zeros((0, 2)))
+    if RASTERIZE_DOTS:
+        dots_canvas.fill(0)
+        dots_canvas[data[:, 1].astype(np.intp), data[:, 0].astype(np.intp)] = 1
+        scat.set_data(dots_canvas)
     else:
-        scat.set_offsets(np.zeros((0, 2)))
+        scat.set_offsets(data)
 
     return [scat, img_obj]
 
@@ -426,15 +780,18 @@ def animate(frame):
 
 def on_process_change():
     """Callback for when processing parameters change"""
-    global pixels
+    global pixels, pixels_phys
     if raw_normalized_data is not None:
         pixels = apply_image_effects(raw_normalized_data)
+        pixels_phys = downsample_for_physics(pixels)
         img_obj.set_data(pixels)
         fig.canvas.draw_idle()
 
 
 # Use Matplotlib-based control panel
-ctrl_panel = ControlPanelMSG(PARAMS, on_process_change, toggle_generation)
+ctrl_panel = ControlPanelMSG(
+    PARAMS, on_process_change, toggle_generation, rebuild_tension_kernel
+)
 
 
 ani = animation.FuncAnimation(